@@ -1,6 +1,7 @@
 import threading
 from collections import deque
 from time import sleep
+from typing import Callable
 
 import yaml
 
@@ -8,32 +9,57 @@ from src.controller.pomodoro_controller import PomodoroController
 from src.model.pomodoro_model import PomodoroState
 from src.model.pomodoro_model_impl import PomodoroTimerImpl
 from src.notification_manager.notification_manager_factory import NotificationManagerFactory
+from src.notification_manager.notification_manager_interface import NotificationManager
+from src.profiling.resource_profiler import ResourceProfiler
 from src.view.basic_view import BasicView
-from src.view.view import PomodoroCommand
+from src.view.view import PomodoroCommand, PomodoroView
+
+_BREAK_STATES = frozenset({PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK})
 
 
 class PomodoroControllerImpl(PomodoroController):
-    def __init__(self, config_path: str) -> None:
+    def __init__(self,
+                 config_path: str,
+                 view_factory: Callable[[Callable[[PomodoroCommand], None], Callable[[], None]], PomodoroView] = BasicView,
+                 notification_manager: NotificationManager | None = None) -> None:
         """
         Initializes the object with the provided configuration file path.
 
         :param config_path: The path to the configuration file.
         :type config_path: str
 
+        :param view_factory: Callable building the view from its play and break actions (default is :class:`BasicView`).
+        :type view_factory: Callable[[Callable[[PomodoroCommand], None], Callable[[], None]], PomodoroView]
+
+        :param notification_manager: Notification manager to use (default is the one created by
+                                     :class:`NotificationManagerFactory`).
+        :type notification_manager: NotificationManager | None
+
         :returns: None
         """
+        config = PomodoroControllerImpl._read_config(config_path)
+        profiling_config = config.pop('profiling', None) or {}
         self._opts = deque()
-        self._pomodoro_timer = PomodoroTimerImpl(**PomodoroControllerImpl._read_config(config_path))
-        self._notification_manager = NotificationManagerFactory.create_notification_manager()
-        self._view = BasicView(play_action=lambda pomodoro_command: self._opts.append(pomodoro_command),
-                               break_action=lambda: self._opts.append(PomodoroCommand.BREAK))
+        self._pomodoro_timer = PomodoroTimerImpl(**config)
+        self._pomodoro_config = self._pomodoro_timer.config
+        self._notification_manager = notification_manager or NotificationManagerFactory.create_notification_manager()
+        profiling_enabled = profiling_config.pop('enabled', False)
+        self._profiler = ResourceProfiler(**profiling_config) if profiling_enabled else None
+        self._view = view_factory(lambda pomodoro_command: self._opts.append(pomodoro_command),
+                                  lambda: self._opts.append(PomodoroCommand.BREAK))
 
     def start(self):
         """
         :reference:`start` from :class:`PomodoroController`.
         """
+        if self._profiler is not None:
+            self._profiler.start()
         threading.Thread(target=self._main_loop, daemon=True).start()
-        self._view.show()
+        try:
+            self._view.show()
+        finally:
+            if self._profiler is not None:
+                self._profiler.stop()
 
     @staticmethod
     def _read_config(config_path) -> dict:
@@ -43,40 +69,52 @@ class PomodoroControllerImpl(PomodoroController):
 
     def _main_loop(self) -> None:
         """Loop that runs the pomodoro timer and updates the view."""
-        pomodoro_config = self._pomodoro_timer.config
-        while True:
-            command = self._opts.popleft() if len(self._opts) else None
-            if command == PomodoroCommand.STUDY:
-                self._pomodoro_timer.study()
-            elif command == PomodoroCommand.PAUSE:
-                self._pomodoro_timer.pause()
-            elif command == PomodoroCommand.RESUME:
-                self._pomodoro_timer.resume()
-            elif command == PomodoroCommand.BREAK:
-                self._pomodoro_timer.take_break()
-            else:
-                self._pomodoro_timer.update()
-
-            pomodoro_data = self._pomodoro_timer.data
-            self._view.change_state_label(pomodoro_data.pomodoro_state)
-            self._view.chage_total_time_remaning_label(pomodoro_data.current_total_study_time)
-
-            if pomodoro_data.pomodoro_state == PomodoroState.STUDYING:
-                self._view.change_timer_label(pomodoro_data.current_study_time)
-            elif pomodoro_data.pomodoro_state in {PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK}:
-                self._view.change_timer_label(pomodoro_data.current_break_time)
-
-            if pomodoro_data.pomodoro_state == PomodoroState.END:
-                self._notification_manager.study_is_over()
-                break
-
-            if pomodoro_data.pomodoro_state in {PomodoroState.SHORT_BREAK, PomodoroState.LONG_BREAK}:
-                if (pomodoro_data.pomodoro_state == PomodoroState.LONG_BREAK and pomodoro_data.current_break_time == pomodoro_config.long_break_time) or \
-                   (pomodoro_data.pomodoro_state == PomodoroState.SHORT_BREAK and pomodoro_data.current_break_time == pomodoro_config.short_break_time):
-                    self._notification_manager.time_to_study()
-                    self._pomodoro_timer.idle()
-
-            if pomodoro_data.pomodoro_state == PomodoroState.STUDYING and pomodoro_data.current_study_time == pomodoro_config.study_time:
-                self._notification_manager.time_to_break()
-
-            sleep(1)
\ No newline at end of file
+        while self.step():
+            sleep(1)
+
+    def step(self) -> bool:
+        """
+        Run one second of the Pomodoro timer, without waiting, and update the view.
+
+        It is called every second by the main loop started by :meth:`start`, and can be called directly to
+        drive the timer without real waiting.
+
+        :returns: False once the study session is over, True otherwise.
+        :rtype: bool
+        """
+        pomodoro_config = self._pomodoro_config
+        command = self._opts.popleft() if self._opts else None
+        if command == PomodoroCommand.STUDY:
+            self._pomodoro_timer.study()
+        elif command == PomodoroCommand.PAUSE:
+            self._pomodoro_timer.pause()
+        elif command == PomodoroCommand.RESUME:
+            self._pomodoro_timer.resume()
+        elif command == PomodoroCommand.BREAK:
+            self._pomodoro_timer.take_break()
+        else:
+            self._pomodoro_timer.update()
+
+        pomodoro_data = self._pomodoro_timer.data
+        self._view.change_state_label(pomodoro_data.pomodoro_state)
+        self._view.chage_total_time_remaning_label(pomodoro_data.current_total_study_time)
+
+        if pomodoro_data.pomodoro_state == PomodoroState.STUDYING:
+            self._view.change_timer_label(pomodoro_data.current_study_time)
+        elif pomodoro_data.pomodoro_state in _BREAK_STATES:
+            self._view.change_timer_label(pomodoro_data.current_break_time)
+
+        if pomodoro_data.pomodoro_state == PomodoroState.END:
+            self._notification_manager.study_is_over()
+            return False
+
+        if pomodoro_data.pomodoro_state in _BREAK_STATES:
+            if (pomodoro_data.pomodoro_state == PomodoroState.LONG_BREAK and pomodoro_data.current_break_time == pomodoro_config.long_break_time) or \
+               (pomodoro_data.pomodoro_state == PomodoroState.SHORT_BREAK and pomodoro_data.current_break_time == pomodoro_config.short_break_time):
+                self._notification_manager.time_to_study()
+                self._pomodoro_timer.idle()
+
+        if pomodoro_data.pomodoro_state == PomodoroState.STUDYING and pomodoro_data.current_study_time == pomodoro_config.study_time:
+            self._notification_manager.time_to_break()
+
+        return True
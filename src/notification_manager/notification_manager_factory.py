@@ -1,5 +1,4 @@
 from src.notification_manager.notification_manager_interface import NotificationManager
-from src.notification_manager.windows_notification_manager import WindowsNotificationManager
 import platform
 
 class _DummyNotificationManager(NotificationManager):
@@ -49,5 +48,8 @@ class NotificationManagerFactory:
         :returns: An instance of :class:`~src.notification_manager.windows_notification_manager.WindowsNotificationManager` if the platform is Windows, otherwise an instance of :class:`_DummyNotificationManager` which performs no actions.
         :rtype: :class:`NotificationManager`
         """
-        return WindowsNotificationManager() if platform.system() == "Windows" else _DummyNotificationManager()
+        if platform.system() != "Windows":
+            return _DummyNotificationManager()
+        from src.notification_manager.windows_notification_manager import WindowsNotificationManager
+        return WindowsNotificationManager()
 
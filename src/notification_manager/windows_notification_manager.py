@@ -4,25 +4,32 @@ from winotify import Notification, audio
 class WindowsNotificationManager(NotificationManager):
     _APP_ID = "Minidoro"
 
-    def time_to_break(self):
-        notification = Notification(app_id=self._APP_ID,
+    def __init__(self):
+        """
+        Builds the three notifications once, so that every call reuses the same
+        :class:`Notification` instead of allocating a new one.
+        """
+        self._break_notification = Notification(app_id=self._APP_ID,
                      title="Break time!",
                      msg="It's time to take a break to recharge",
                      duration="short")
-        notification.set_audio(audio.Reminder, loop=False)
-        notification.show()
-    def time_to_study(self):
-        notification = Notification(app_id=self._APP_ID,
+        self._break_notification.set_audio(audio.Reminder, loop=False)
+        self._study_notification = Notification(app_id=self._APP_ID,
                      title="Study time!",
                      msg="It's time to study hard",
                      duration="short")
-        notification.set_audio(audio.LoopingAlarm, loop=True)
-        notification.show()
-
-    def study_is_over(self):
-        notification = Notification(app_id=self._APP_ID,
+        self._study_notification.set_audio(audio.LoopingAlarm, loop=True)
+        self._end_notification = Notification(app_id=self._APP_ID,
                      title="End",
                      msg="Study session is over, good job!",
                      duration="short")
-        notification.set_audio(audio.LoopingAlarm2, loop=False)
-        notification.show()
\ No newline at end of file
+        self._end_notification.set_audio(audio.LoopingAlarm2, loop=False)
+
+    def time_to_break(self):
+        self._break_notification.show()
+
+    def time_to_study(self):
+        self._study_notification.show()
+
+    def study_is_over(self):
+        self._end_notification.show()
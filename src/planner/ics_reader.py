@@ -0,0 +1,172 @@
+"""
+Reader of the availability calendar.
+
+Every event of a local ICS file is read as a time window available for studying. Times in UTC are converted
+to local time, times with a ``TZID`` or without a time zone are read as local time. Cancelled events and
+all-day events are left out, since an all-day event would make the whole day, night included, available.
+
+Daily and weekly recurrence rules are expanded, with ``INTERVAL``, ``BYDAY``, ``COUNT``, ``UNTIL``, ``EXDATE``
+and modified occurrences (``RECURRENCE-ID``). Any other recurrence raises :class:`ValueError` instead of being
+silently read as a single window.
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+
+_DURATION_PATTERN = re.compile(r'([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+_WEEKDAYS = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+_SUPPORTED_RULE_PARTS = {'FREQ', 'INTERVAL', 'BYDAY', 'COUNT', 'UNTIL', 'WKST'}
+
+
+def read_ics_availability(ics_path: str, until: datetime | None = None) -> list[tuple[datetime, datetime]]:
+    """
+    Read the events of an ICS file as available time windows.
+
+    :param ics_path: The path to the ICS file.
+    :type ics_path: str
+
+    :param until: Time after which recurring events are no longer expanded. It is required only when a
+                  recurrence rule has neither ``COUNT`` nor ``UNTIL`` (default is no limit).
+    :type until: datetime | None
+
+    :return: The ``(start, end)`` windows, as naive local datetimes, event by event in the order of the file.
+    :rtype: list[tuple[datetime, datetime]]
+
+    :raises ValueError: If an event has a recurrence that cannot be expanded.
+    """
+    with open(ics_path, 'r', encoding='utf-8') as file:
+        content = re.sub(r'\r?\n[ \t]', '', file.read())
+
+    events = []
+    event = None
+    nesting = 0
+    for line in content.splitlines():
+        if event is None:
+            if line == 'BEGIN:VEVENT':
+                event = {}
+        elif line.startswith('BEGIN:'):
+            nesting += 1
+        elif line.startswith('END:'):
+            if nesting:
+                nesting -= 1
+            else:
+                events.append(event)
+                event = None
+        elif not nesting:
+            name, value = _split_property(line)
+            if name == 'EXDATE':
+                event.setdefault(name, []).extend(value.strip().split(','))
+            else:
+                event[name] = value.strip()
+
+    overridden = {}
+    for event in events:
+        if 'RECURRENCE-ID' in event:
+            overridden.setdefault(event.get('UID'), set()).add(_parse_datetime(event['RECURRENCE-ID']))
+    events = [event for event in events
+              if 'DTSTART' in event and len(event['DTSTART']) != 8 and event.get('STATUS', '').upper() != 'CANCELLED']
+
+    windows = []
+    for event in events:
+        if 'RDATE' in event:
+            raise ValueError(f'Events with RDATE are not supported: {event.get("SUMMARY", event["DTSTART"])}')
+        start, end = _event_window(event)
+        if 'RRULE' in event and 'RECURRENCE-ID' not in event:
+            excluded = {_parse_datetime(value) for value in event.get('EXDATE', [])}
+            excluded |= overridden.get(event.get('UID'), set())
+            windows.extend((occurrence, occurrence + (end - start))
+                           for occurrence in _expand_rule(event['RRULE'], start, until)
+                           if occurrence not in excluded and end > start)
+        elif end > start:
+            windows.append((start, end))
+    return windows
+
+
+def _split_property(line: str) -> tuple[str, str]:
+    """Return the upper case name and the value of a content line, skipping colons in quoted parameters."""
+    quoted = False
+    for index, character in enumerate(line):
+        if character == '"':
+            quoted = not quoted
+        elif character == ':' and not quoted:
+            return line[:index].split(';', 1)[0].upper(), line[index + 1:].strip()
+    return line.split(';', 1)[0].upper(), ''
+
+
+def _event_window(event: dict) -> tuple[datetime, datetime]:
+    """Return the window of an event from its DTSTART and its DTEND or DURATION."""
+    start = _parse_datetime(event['DTSTART'])
+    if 'DTEND' in event:
+        end = _parse_datetime(event['DTEND'])
+    elif 'DURATION' in event:
+        end = start + _parse_duration(event['DURATION'])
+    else:
+        end = start
+    return start, end
+
+
+def _expand_rule(rule: str, start: datetime, until: datetime | None) -> list[datetime]:
+    """Return the starts of the occurrences of a daily or weekly recurrence rule."""
+    parts = dict(part.split('=', 1) for part in rule.upper().split(';') if part)
+    frequency = parts.get('FREQ')
+    if frequency not in {'DAILY', 'WEEKLY'} or not parts.keys() <= _SUPPORTED_RULE_PARTS:
+        raise ValueError(f'Unsupported recurrence rule: {rule}')
+    by_day = parts.get('BYDAY')
+    if by_day is not None and any(day not in _WEEKDAYS for day in by_day.split(',')):
+        raise ValueError(f'Unsupported recurrence rule: {rule}')
+
+    interval = int(parts.get('INTERVAL', 1))
+    count = int(parts['COUNT']) if 'COUNT' in parts else None
+    last = until
+    if 'UNTIL' in parts:
+        rule_until = _parse_datetime(parts['UNTIL'])
+        if len(parts['UNTIL']) == 8:
+            rule_until += timedelta(days=1) - timedelta(microseconds=1)
+        last = rule_until if last is None else min(last, rule_until)
+    if count is None and last is None:
+        raise ValueError(f'Recurrence rule without COUNT or UNTIL needs an until limit: {rule}')
+
+    if by_day:
+        weekdays = sorted({_WEEKDAYS.index(day) for day in by_day.split(',')})
+    else:
+        weekdays = list(range(7)) if frequency == 'DAILY' else [start.weekday()]
+    if frequency == 'DAILY':
+        if all((start + timedelta(days=interval * day)).weekday() not in weekdays for day in range(7)):
+            return []
+        period, offsets = timedelta(days=interval), [timedelta()]
+    else:
+        period = timedelta(weeks=interval)
+        offsets = [timedelta(days=weekday - start.weekday()) for weekday in weekdays]
+
+    occurrences = []
+    period_start = start
+    while True:
+        for offset in offsets:
+            occurrence = period_start + offset
+            if occurrence < start or (frequency == 'DAILY' and occurrence.weekday() not in weekdays):
+                continue
+            if (last is not None and occurrence > last) or (count is not None and len(occurrences) == count):
+                return occurrences
+            occurrences.append(occurrence)
+        period_start += period
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ICS DATE or DATE-TIME value as a naive local datetime."""
+    if len(value) == 8:
+        return datetime.combine(date(int(value[:4]), int(value[4:6]), int(value[6:])), datetime.min.time())
+    if value.endswith('Z'):
+        utc_time = datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc)
+        return utc_time.astimezone().replace(tzinfo=None)
+    return datetime.strptime(value, '%Y%m%dT%H%M%S')
+
+
+def _parse_duration(value: str) -> timedelta:
+    """Parse an ICS DURATION value."""
+    match = _DURATION_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f'Invalid ICS duration: {value}')
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+                         minutes=int(minutes or 0), seconds=int(seconds or 0))
+    return -duration if sign == '-' else duration
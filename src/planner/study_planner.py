@@ -0,0 +1,68 @@
+"""
+Study planner core components.
+
+This module defines the interface and data structures used to plan the study sessions of several weeks
+across the available time windows.
+"""
+
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from datetime import date, datetime
+
+
+#: Named tuple representing a block of time planned for studying or for a break.
+PlannedBlock = namedtuple('PlannedBlock', ['start', 'end', 'pomodoro_state'])
+"""
+PlannedBlock(start, end, pomodoro_state)
+
+Attributes
+----------
+start : datetime
+    Start of the block.
+end : datetime
+    End of the block.
+pomodoro_state : PomodoroState
+    ``STUDYING`` for a study session, ``SHORT_BREAK`` or ``LONG_BREAK`` for a break.
+"""
+
+
+class StudyPlanner(ABC):
+    @property
+    @abstractmethod
+    def blocks(self) -> list[PlannedBlock]:
+        """
+        :reference:`blocks` from :class:`StudyPlanner`.
+
+        Return the planned study sessions and breaks, sorted by start.
+
+        :return: The planned blocks.
+        :rtype: list[PlannedBlock]
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def unmet_targets(self) -> dict[date, int]:
+        """
+        :reference:`unmet_targets` from :class:`StudyPlanner`.
+
+        Return the study time that could not be planned, by week.
+
+        :return: The seconds of study left unplanned, keyed by the Monday of the week. Weeks whose target is
+                 fully planned are not included.
+        :rtype: dict[date, int]
+        """
+        pass
+
+    @abstractmethod
+    def end_session_early(self, start: datetime, actual_end: datetime) -> None:
+        """
+        Record that the study session starting at ``start`` ended at ``actual_end`` and replan the lost time.
+
+        :param start: Start of the planned study session.
+        :type start: datetime
+
+        :param actual_end: Time at which the session actually ended.
+        :type actual_end: datetime
+        """
+        pass
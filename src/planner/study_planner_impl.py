@@ -0,0 +1,204 @@
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+from src.model.pomodoro_model import PomodoroConfig, PomodoroState
+from src.planner.study_planner import PlannedBlock, StudyPlanner
+
+
+class _WeekPlan:
+    """Plan of a single week, with the cursor from which more study time can be planned."""
+
+    def __init__(self, windows: list[tuple[datetime, datetime]]) -> None:
+        self.windows = windows
+        self.blocks = []
+        self.block_starts = []
+        self.window_index = 0
+        self.cursor = windows[0][0] if windows else None
+        self.studies_in_sitting = 0
+        self.extendable = False
+        self.unmet = 0
+
+
+class StudyPlannerImpl(StudyPlanner):
+
+    def __init__(self,
+                 config: PomodoroConfig,
+                 availability: Iterable[tuple[datetime, datetime]],
+                 weekly_targets: int | Mapping[date, int],
+                 min_study_time: int | None = None,
+                 not_before: datetime | None = None) -> None:
+        """
+        Initializes the planner and plans the study sessions of every week.
+
+        The available windows are merged with a sweep over their sorted bounds and split at the start of every
+        week. Each window is a sitting: it is filled from its start with study sessions of ``study_time``
+        separated by breaks, a long one every ``long_break_interval`` breaks, until the target of the week is
+        reached.
+
+        :param config: The configuration of the Pomodoro timer, with times in seconds.
+        :type config: PomodoroConfig
+
+        :param availability: The ``(start, end)`` windows available for studying, in any order and possibly
+                             overlapping.
+        :type availability: Iterable[tuple[datetime, datetime]]
+
+        :param weekly_targets: Seconds to study every week from the first to the last week with available
+                               windows, or seconds to study keyed by any day of the week.
+        :type weekly_targets: int | Mapping[date, int]
+
+        :param min_study_time: Shortest study session in seconds worth planning at the end of a window
+                               (default is ``study_time``).
+        :type min_study_time: int | None
+
+        :param not_before: Time before which nothing is planned (default is no limit).
+        :type not_before: datetime | None
+        """
+        self._config = config
+        self._min_study_time = config.study_time if min_study_time is None else min_study_time
+        self._weeks = {}
+
+        windows_by_week = {}
+        for window_start, window_end in StudyPlannerImpl._merge_windows(availability, not_before):
+            for week_window in StudyPlannerImpl._split_by_week(window_start, window_end):
+                windows_by_week.setdefault(StudyPlannerImpl._week_of(week_window[0]), []).append(week_window)
+
+        if isinstance(weekly_targets, Mapping):
+            targets = {}
+            for week, target in weekly_targets.items():
+                week = StudyPlannerImpl._week_of(week)
+                targets[week] = targets.get(week, 0) + int(target)
+        else:
+            weeks = sorted(windows_by_week)
+            week_count = (weeks[-1] - weeks[0]).days // 7 + 1 if weeks else 0
+            targets = {weeks[0] + timedelta(weeks=week): int(weekly_targets) for week in range(week_count)}
+        for week in sorted(targets):
+            week_plan = _WeekPlan(windows_by_week.get(week, []))
+            self._weeks[week] = week_plan
+            self._fill(week_plan, targets[week])
+
+    @property
+    def blocks(self) -> list[PlannedBlock]:
+        """
+        :reference:`blocks` from :class:`StudyPlanner`.
+        """
+        return [block for week_plan in self._weeks.values() for block in week_plan.blocks]
+
+    @property
+    def unmet_targets(self) -> dict[date, int]:
+        """
+        :reference:`unmet_targets` from :class:`StudyPlanner`.
+        """
+        return {week: week_plan.unmet for week, week_plan in self._weeks.items() if week_plan.unmet}
+
+    def end_session_early(self, start: datetime, actual_end: datetime) -> None:
+        """
+        :reference:`end_session_early` from :class:`StudyPlanner`.
+
+        Only the week of the session is touched: the rest of its plan is kept and the lost time is planned
+        after its last session, so the cost does not depend on the number of windows.
+        """
+        week_plan = self._weeks.get(StudyPlannerImpl._week_of(start))
+        index = bisect_left(week_plan.block_starts, start) if week_plan is not None else 0
+        if week_plan is None or index == len(week_plan.blocks) or week_plan.blocks[index].start != start \
+                or week_plan.blocks[index].pomodoro_state != PomodoroState.STUDYING:
+            raise ValueError(f'No study session planned at {start}.')
+        block = week_plan.blocks[index]
+        if not block.start < actual_end < block.end:
+            raise ValueError(f'The session starting at {start} must end after its start and before {block.end}.')
+
+        week_plan.blocks[index] = block._replace(end=actual_end)
+        if index == len(week_plan.blocks) - 1:
+            week_plan.extendable = False
+        unmet = week_plan.unmet
+        week_plan.unmet = 0
+        self._fill(week_plan, int((block.end - actual_end).total_seconds()) + unmet)
+
+    def _fill(self, week_plan: _WeekPlan, study_time: int) -> None:
+        """Plans the given seconds of study from the cursor of the week, keeping the rest as unmet."""
+        config = self._config
+        windows = week_plan.windows
+        while study_time > 0 and week_plan.window_index < len(windows):
+            window_end = windows[week_plan.window_index][1]
+
+            if week_plan.extendable:
+                last_block = week_plan.blocks[-1]
+                extension = min(config.study_time - int((last_block.end - last_block.start).total_seconds()),
+                                study_time,
+                                int((window_end - last_block.end).total_seconds()))
+                week_plan.extendable = False
+                if extension > 0:
+                    week_plan.blocks[-1] = last_block._replace(end=last_block.end + timedelta(seconds=extension))
+                    week_plan.cursor = week_plan.blocks[-1].end
+                    study_time -= extension
+                    continue
+
+            break_block = None
+            study_start = week_plan.cursor
+            if week_plan.studies_in_sitting:
+                if week_plan.studies_in_sitting % config.long_break_interval == 0:
+                    break_state, break_time = PomodoroState.LONG_BREAK, config.long_break_time
+                else:
+                    break_state, break_time = PomodoroState.SHORT_BREAK, config.short_break_time
+                study_start = week_plan.cursor + timedelta(seconds=break_time)
+                break_block = PlannedBlock(week_plan.cursor, study_start, break_state)
+
+            session_time = min(config.study_time, study_time, int((window_end - study_start).total_seconds()))
+            if session_time <= 0 or session_time < min(self._min_study_time, study_time):
+                week_plan.window_index += 1
+                week_plan.studies_in_sitting = 0
+                if week_plan.window_index < len(windows):
+                    week_plan.cursor = windows[week_plan.window_index][0]
+                continue
+
+            if break_block is not None and break_block.end > break_block.start:
+                self._append(week_plan, break_block)
+            study_end = study_start + timedelta(seconds=session_time)
+            self._append(week_plan, PlannedBlock(study_start, study_end, PomodoroState.STUDYING))
+            week_plan.cursor = study_end
+            week_plan.studies_in_sitting += 1
+            week_plan.extendable = session_time < config.study_time
+            study_time -= session_time
+
+        week_plan.unmet += study_time
+
+    @staticmethod
+    def _append(week_plan: _WeekPlan, block: PlannedBlock) -> None:
+        """Appends a block to the plan of the week, keeping the index of the starts in sync."""
+        week_plan.blocks.append(block)
+        week_plan.block_starts.append(block.start)
+
+    @staticmethod
+    def _merge_windows(availability: Iterable[tuple[datetime, datetime]],
+                       not_before: datetime | None) -> list[tuple[datetime, datetime]]:
+        """Sorts the windows and merges the overlapping or adjacent ones in a single sweep."""
+        merged = []
+        for window_start, window_end in sorted(availability):
+            if not_before is not None:
+                window_start = max(window_start, not_before)
+            if window_end <= window_start:
+                continue
+            if merged and window_start <= merged[-1][1]:
+                if window_end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], window_end)
+            else:
+                merged.append((window_start, window_end))
+        return merged
+
+    @staticmethod
+    def _split_by_week(window_start: datetime, window_end: datetime) -> list[tuple[datetime, datetime]]:
+        """Splits a window at the start of every week it crosses."""
+        windows = []
+        week_end = datetime.combine(StudyPlannerImpl._week_of(window_start) + timedelta(weeks=1), datetime.min.time())
+        while week_end < window_end:
+            windows.append((window_start, week_end))
+            window_start, week_end = week_end, week_end + timedelta(weeks=1)
+        windows.append((window_start, window_end))
+        return windows
+
+    @staticmethod
+    def _week_of(moment: date | datetime) -> date:
+        """Returns the Monday of the week of the given day or moment."""
+        day = moment.date() if isinstance(moment, datetime) else moment
+        return day - timedelta(days=day.weekday())
@@ -0,0 +1,222 @@
+"""
+Resource profiling for long-running sessions.
+
+This module samples memory, garbage collector and thread statistics of the running process at a fixed
+interval and writes them, one compact JSON line per sample, to a rotating log file.
+"""
+
+import gc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from logging.handlers import RotatingFileHandler
+
+
+def current_rss() -> int | None:
+    """
+    Return the resident set size of the current process in bytes.
+
+    On platforms where only the peak value is available the peak resident set size is returned instead.
+
+    :return: The resident set size in bytes, or None if it cannot be read.
+    :rtype: int | None
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD),
+                        ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t),
+                        ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t),
+                        ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.WorkingSetSize
+
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def current_handles() -> int | None:
+    """
+    Return the number of handles (Windows) or file descriptors (Linux) opened by the current process.
+
+    :return: The number of open handles, or None if it cannot be read.
+    :rtype: int | None
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        count = wintypes.DWORD()
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.kernel32.GetProcessHandleCount(process, ctypes.byref(count)):
+            return None
+        return count.value
+
+    try:
+        return len(os.listdir('/proc/self/fd'))
+    except OSError:
+        return None
+
+
+class ResourceProfiler:
+    """
+    Periodically samples the resource usage of the process and logs it to a rotating file.
+
+    Every sample is a single JSON line with the following keys:
+
+    t : float
+        Unix timestamp of the sample.
+    rss : int | None
+        Resident set size in bytes.
+    threads : int
+        Number of alive threads.
+    handles : int | None
+        Number of open handles or file descriptors.
+    gc : list[list[int]]
+        ``[collections, collected, uncollectable]`` for every garbage collector generation.
+    gc_count : list[int]
+        Current allocation counters of every garbage collector generation.
+    traced : list[int]
+        ``[current, peak]`` size in bytes of the memory traced by :mod:`tracemalloc`.
+    top : list[list]
+        ``[location, size, count]`` of the top allocators traced by :mod:`tracemalloc`.
+    """
+
+    _LOGGER_NAME = 'minidoro.profiling'
+
+    def __init__(self,
+                 log_path: str = 'minidoro_profile.log',
+                 interval: float = 60,
+                 top_allocators: int = 5,
+                 trace_frames: int = 1,
+                 max_bytes: int = 1024 * 1024,
+                 backup_count: int = 3) -> None:
+        """
+        Initializes the profiler with the given configuration.
+
+        :param log_path: Path of the log file (default is ``minidoro_profile.log``).
+        :type log_path: str
+
+        :param interval: Seconds between two samples (default is 60 seconds).
+        :type interval: float
+
+        :param top_allocators: Number of top allocators logged in every sample (default is 5).
+        :type top_allocators: int
+
+        :param trace_frames: Number of frames stored by :mod:`tracemalloc` for every allocation (default is 1).
+        :type trace_frames: int
+
+        :param max_bytes: Size in bytes after which the log file is rotated (default is 1 MiB).
+        :type max_bytes: int
+
+        :param backup_count: Number of rotated log files kept (default is 3).
+        :type backup_count: int
+        """
+        self._log_path = log_path
+        self._interval = interval
+        self._top_allocators = top_allocators
+        self._trace_frames = trace_frames
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._handler = None
+        self._logger = logging.getLogger(self._LOGGER_NAME)
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """
+        Start tracing allocations and sampling in a background daemon thread.
+        """
+        if self._thread is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._trace_frames)
+            self._started_tracing = True
+        self._handler = RotatingFileHandler(self._log_path,
+                                            maxBytes=self._max_bytes,
+                                            backupCount=self._backup_count,
+                                            encoding='utf-8')
+        self._handler.setFormatter(logging.Formatter('%(message)s'))
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(self._handler)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sampling_loop, name='minidoro-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop sampling, write a last sample and release the log file.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._log(self.sample())
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
+        self._handler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def sample(self) -> dict:
+        """
+        Take a single sample of the resource usage of the process.
+
+        :return: The sample, with the keys described in :class:`ResourceProfiler`.
+        :rtype: dict
+        """
+        sample = {
+            't': round(time.time(), 3),
+            'rss': current_rss(),
+            'threads': threading.active_count(),
+            'handles': current_handles(),
+            'gc': [[stats['collections'], stats['collected'], stats['uncollectable']] for stats in gc.get_stats()],
+            'gc_count': list(gc.get_count()),
+        }
+        if tracemalloc.is_tracing():
+            sample['traced'] = list(tracemalloc.get_traced_memory())
+            snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+            statistics = snapshot.statistics('lineno')[:self._top_allocators]
+            sample['top'] = [[f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}', stat.size, stat.count]
+                             for stat in statistics]
+        return sample
+
+    def _sampling_loop(self) -> None:
+        """Loop that logs a sample every interval until the profiler is stopped."""
+        while not self._stop_event.wait(self._interval):
+            self._log(self.sample())
+
+    def _log(self, sample: dict) -> None:
+        """Write the sample to the log as a compact JSON line."""
+        self._logger.info(json.dumps(sample, separators=(',', ':')))
@@ -0,0 +1,186 @@
+"""
+Soak test for the Pomodoro controller.
+
+This module drives a simulated multi-day session through :class:`PomodoroControllerImpl`, one step per simulated
+second and without any real waiting. Every simulated day runs with a :class:`ResourceProfiler` started and then
+stopped, and the test fails if the memory traced by :mod:`tracemalloc` grows past a threshold or if the number
+of threads or handles grows.
+
+By default notifications are only counted, so their allocations are not covered; pass ``--real-notifications``
+to use the notification manager of the platform, which on Windows shows every notification of the session.
+
+Run it from the root of the project::
+
+    python -m src.profiling.soak_test --days 7 --max-growth-kib 256
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable
+
+import yaml
+
+from src.controller.pomodoro_controller_impl import PomodoroControllerImpl
+from src.model.pomodoro_model import PomodoroState
+from src.notification_manager.notification_manager_factory import NotificationManagerFactory
+from src.notification_manager.notification_manager_interface import NotificationManager
+from src.profiling.resource_profiler import ResourceProfiler
+from src.view.view import PomodoroCommand, PomodoroView
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+_DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'configurations', 'config.yaml')
+
+
+class _HeadlessView(PomodoroView):
+    """
+    Implementation of :class:`PomodoroView` without any window, keeping the last state shown to the user.
+    """
+
+    def __init__(self, play_action: Callable[[PomodoroCommand], None], break_action: Callable[[], None]) -> None:
+        self.play_action = play_action
+        self.break_action = break_action
+        self.state = PomodoroState.IDLE
+
+    def change_state_label(self, state: PomodoroState) -> None:
+        self.state = state
+
+
+class _SimulatedUserNotificationManager(NotificationManager):
+    """
+    Implementation of :class:`NotificationManager` that counts the notifications and remembers when a break is
+    due, forwarding every notification to the wrapped manager if any.
+    """
+
+    def __init__(self, notification_manager: NotificationManager | None = None) -> None:
+        self._notification_manager = notification_manager
+        self.notifications = 0
+        self.break_due = False
+
+    def time_to_break(self):
+        self.notifications += 1
+        self.break_due = True
+        if self._notification_manager is not None:
+            self._notification_manager.time_to_break()
+
+    def time_to_study(self):
+        self.notifications += 1
+        if self._notification_manager is not None:
+            self._notification_manager.time_to_study()
+
+    def study_is_over(self):
+        self.notifications += 1
+        if self._notification_manager is not None:
+            self._notification_manager.study_is_over()
+
+
+def run_soak_test(config_path: str = _DEFAULT_CONFIG_PATH,
+                  days: int = 7,
+                  max_growth_kib: int = 256,
+                  real_notifications: bool = False) -> bool:
+    """
+    Simulate a session of the given number of days and check the growth of the resources.
+
+    The first simulated day is used as warm-up, the growth of the traced memory, of the threads and of the
+    handles is measured over the remaining days. The simulated user starts studying as soon as the timer is idle
+    and takes a break as soon as it is notified to, so the session never ends. A :class:`ResourceProfiler` is
+    started at the beginning of every simulated day and stopped at its end, so its thread and log file are part
+    of what is checked.
+
+    :param config_path: The path to the configuration file (default is the project configuration).
+    :type config_path: str
+
+    :param days: Number of simulated days, at least 2 (default is 7).
+    :type days: int
+
+    :param max_growth_kib: Maximum allowed growth in KiB of the traced memory (default is 256).
+    :type max_growth_kib: int
+
+    :param real_notifications: Whether to show the notifications with the manager of the platform instead of
+                               only counting them (default is False).
+    :type real_notifications: bool
+
+    :return: True if the memory growth is within the threshold and threads and handles did not grow,
+             False otherwise.
+    :rtype: bool
+    """
+    if days < 2:
+        raise ValueError('The soak test needs at least 2 simulated days.')
+
+    with open(config_path, 'r') as file:
+        config = yaml.safe_load(file)
+    config.pop('profiling', None)
+    config.update(stop_on_timeout=False, stop_on_end=False)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            soak_config_path = os.path.join(directory, 'config.yaml')
+            with open(soak_config_path, 'w') as file:
+                yaml.safe_dump(config, file)
+
+            views = []
+
+            def view_factory(play_action, break_action):
+                views.append(_HeadlessView(play_action, break_action))
+                return views[-1]
+
+            notification_manager = _SimulatedUserNotificationManager(
+                NotificationManagerFactory.create_notification_manager() if real_notifications else None)
+            controller = PomodoroControllerImpl(soak_config_path,
+                                                view_factory=view_factory,
+                                                notification_manager=notification_manager)
+            view = views[0]
+            profiler = ResourceProfiler(log_path=os.path.join(directory, 'profile.log'),
+                                        interval=0.5,
+                                        top_allocators=3)
+
+            baseline = None
+            for day in range(days):
+                profiler.start()
+                for _ in range(_SECONDS_PER_DAY):
+                    if view.state == PomodoroState.IDLE:
+                        view.play_action(PomodoroCommand.STUDY)
+                    elif notification_manager.break_due:
+                        notification_manager.break_due = False
+                        view.break_action()
+                    controller.step()
+                profiler.stop()
+                gc.collect()
+                sample = profiler.sample()
+                print(f"day {day + 1}: traced={sample['traced'][0]} rss={sample['rss']} threads={sample['threads']} "
+                      f"handles={sample['handles']} notifications={notification_manager.notifications}")
+                if baseline is None:
+                    baseline = sample
+
+        growth_kib = (sample['traced'][0] - baseline['traced'][0]) / 1024
+        print(f'traced memory growth after warm-up: {growth_kib:.1f} KiB (threshold {max_growth_kib} KiB)')
+        for location, size, count in sample['top']:
+            print(f'  {location}: {size} B in {count} blocks')
+        passed = growth_kib <= max_growth_kib
+        for resource in ('threads', 'handles'):
+            if baseline[resource] is not None and sample[resource] is not None \
+                    and sample[resource] > baseline[resource]:
+                print(f'{resource} grew after warm-up: {baseline[resource]} -> {sample[resource]}')
+                passed = False
+        return passed
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Soak test of the Pomodoro controller.')
+    parser.add_argument('--config', default=_DEFAULT_CONFIG_PATH, help='path to the configuration file')
+    parser.add_argument('--days', type=int, default=7, help='number of simulated days')
+    parser.add_argument('--max-growth-kib', type=int, default=256, help='maximum allowed memory growth in KiB')
+    parser.add_argument('--real-notifications', action='store_true',
+                        help='show the notifications instead of only counting them')
+    arguments = parser.parse_args()
+    sys.exit(0 if run_soak_test(arguments.config, arguments.days, arguments.max_growth_kib,
+                                arguments.real_notifications) else 1)
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.planner.ics_reader import read_ics_availability
+
+
+class IcsReaderTest(unittest.TestCase):
+
+    def _read(self, events: str, until: datetime | None = None) -> list[tuple[datetime, datetime]]:
+        """Write the events in a temporary calendar and read its availability."""
+        with tempfile.TemporaryDirectory() as directory:
+            ics_path = os.path.join(directory, 'availability.ics')
+            with open(ics_path, 'w', encoding='utf-8') as file:
+                file.write(f'BEGIN:VCALENDAR\nVERSION:2.0\n{events.strip()}\nEND:VCALENDAR\n')
+            return read_ics_availability(ics_path, until)
+
+    def test_event_with_end_or_duration(self):
+        windows = self._read("""
+BEGIN:VEVENT
+DTSTART:20261019T090000
+DTEND:20261019T110000
+END:VEVENT
+BEGIN:VEVENT
+DTSTART;TZID=Europe/Rome:20261020T140000
+DURATION:PT1H30M
+END:VEVENT
+""")
+        self.assertEqual(windows, [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 11)),
+                                   (datetime(2026, 10, 20, 14), datetime(2026, 10, 20, 15, 30))])
+
+    def test_folded_lines(self):
+        windows = self._read("""
+BEGIN:VEVENT
+SUMMARY:Study
+  time
+DTSTART:20261019T0900
+ 00
+DTEND:20261019T100000
+END:VEVENT
+""")
+        self.assertEqual(windows, [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 10))])
+
+    def test_quoted_parameter_with_colon(self):
+        windows = self._read("""
+BEGIN:VEVENT
+DTSTART;TZID="(UTC+01:00) Amsterdam":20261023T090000
+DTEND;TZID="(UTC+01:00) Amsterdam":20261023T100000
+END:VEVENT
+""")
+        self.assertEqual(windows, [(datetime(2026, 10, 23, 9), datetime(2026, 10, 23, 10))])
+
+    def test_nested_alarm_is_ignored(self):
+        windows = self._read("""
+BEGIN:VEVENT
+DTSTART:20261019T090000
+DURATION:PT2H
+BEGIN:VALARM
+TRIGGER:-PT5M
+DURATION:PT5M
+END:VALARM
+END:VEVENT
+""")
+        self.assertEqual(windows, [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 11))])
+
+    def test_cancelled_and_all_day_events_are_left_out(self):
+        windows = self._read("""
+BEGIN:VEVENT
+STATUS:CANCELLED
+DTSTART:20261019T090000
+DTEND:20261019T100000
+END:VEVENT
+BEGIN:VEVENT
+DTSTART;VALUE=DATE:20261020
+END:VEVENT
+""")
+        self.assertEqual(windows, [])
+
+    def test_weekly_rule_with_until_and_exdate(self):
+        windows = self._read("""
+BEGIN:VEVENT
+DTSTART:20261019T140000
+DTEND:20261019T160000
+RRULE:FREQ=WEEKLY;BYDAY=MO,WE,FR;UNTIL=20261028
+EXDATE:20261023T140000
+END:VEVENT
+""")
+        self.assertEqual([start for start, _ in windows],
+                         [datetime(2026, 10, 19, 14), datetime(2026, 10, 21, 14),
+                          datetime(2026, 10, 26, 14), datetime(2026, 10, 28, 14)])
+        self.assertTrue(all(end - start == windows[0][1] - windows[0][0] for start, end in windows))
+
+    def test_daily_rule_with_interval_and_count(self):
+        windows = self._read("""
+BEGIN:VEVENT
+DTSTART:20261101T080000
+DTEND:20261101T090000
+RRULE:FREQ=DAILY;INTERVAL=2;COUNT=3
+END:VEVENT
+""")
+        self.assertEqual([start for start, _ in windows],
+                         [datetime(2026, 11, 1, 8), datetime(2026, 11, 3, 8), datetime(2026, 11, 5, 8)])
+
+    def test_overridden_and_cancelled_occurrences(self):
+        windows = self._read("""
+BEGIN:VEVENT
+UID:study
+DTSTART:20261019T090000
+DTEND:20261019T110000
+RRULE:FREQ=WEEKLY;COUNT=4
+END:VEVENT
+BEGIN:VEVENT
+UID:study
+RECURRENCE-ID:20261026T090000
+STATUS:CANCELLED
+DTSTART:20261026T090000
+DTEND:20261026T110000
+END:VEVENT
+BEGIN:VEVENT
+UID:study
+RECURRENCE-ID:20261102T090000
+DTSTART:20261102T150000
+DTEND:20261102T160000
+END:VEVENT
+""")
+        self.assertEqual(sorted(windows), [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 11)),
+                                           (datetime(2026, 11, 2, 15), datetime(2026, 11, 2, 16)),
+                                           (datetime(2026, 11, 9, 9), datetime(2026, 11, 9, 11))])
+
+    def test_unbounded_rule_needs_until(self):
+        events = """
+BEGIN:VEVENT
+DTSTART:20261019T090000
+DTEND:20261019T100000
+RRULE:FREQ=WEEKLY
+END:VEVENT
+"""
+        with self.assertRaises(ValueError):
+            self._read(events)
+        self.assertEqual(len(self._read(events, until=datetime(2026, 11, 1))), 2)
+
+    def test_unsupported_recurrences_raise(self):
+        for recurrence in ('RRULE:FREQ=MONTHLY;COUNT=2', 'RRULE:FREQ=WEEKLY;BYDAY=1MO;COUNT=2',
+                           'RDATE:20261025T090000'):
+            with self.subTest(recurrence=recurrence), self.assertRaises(ValueError):
+                self._read(f"""
+BEGIN:VEVENT
+DTSTART:20261019T090000
+DTEND:20261019T100000
+{recurrence}
+END:VEVENT
+""")
+
+
+if __name__ == '__main__':
+    unittest.main()
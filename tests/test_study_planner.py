@@ -0,0 +1,122 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from src.model.pomodoro_model import PomodoroConfig, PomodoroState
+from src.planner.study_planner_impl import StudyPlannerImpl
+
+_MINUTE = 60
+_HOUR = 60 * _MINUTE
+
+
+def _config(short_break_time: int = 5, long_break_time: int = 10) -> PomodoroConfig:
+    """Configuration with sessions of 30 minutes and a long break every 4 breaks, times in seconds."""
+    return PomodoroConfig(total_study_time=240 * _MINUTE,
+                          study_time=30 * _MINUTE,
+                          short_break_time=short_break_time * _MINUTE,
+                          long_break_time=long_break_time * _MINUTE,
+                          long_break_interval=4,
+                          stop_on_timeout=False,
+                          stop_on_end=False)
+
+
+def _study_time(blocks) -> int:
+    """Seconds of study in the blocks."""
+    return sum(int((block.end - block.start).total_seconds())
+               for block in blocks if block.pomodoro_state == PomodoroState.STUDYING)
+
+
+class StudyPlannerImplTest(unittest.TestCase):
+
+    def test_overlapping_windows_are_merged(self):
+        availability = [(datetime(2026, 10, 19, 10), datetime(2026, 10, 19, 11, 5)),
+                        (datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 10, 30))]
+        planner = StudyPlannerImpl(_config(), availability, 2 * _HOUR)
+
+        self.assertEqual([(block.start, block.end, block.pomodoro_state) for block in planner.blocks],
+                         [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 9, 30), PomodoroState.STUDYING),
+                          (datetime(2026, 10, 19, 9, 30), datetime(2026, 10, 19, 9, 35), PomodoroState.SHORT_BREAK),
+                          (datetime(2026, 10, 19, 9, 35), datetime(2026, 10, 19, 10, 5), PomodoroState.STUDYING),
+                          (datetime(2026, 10, 19, 10, 5), datetime(2026, 10, 19, 10, 10), PomodoroState.SHORT_BREAK),
+                          (datetime(2026, 10, 19, 10, 10), datetime(2026, 10, 19, 10, 40), PomodoroState.STUDYING)])
+        self.assertEqual(planner.unmet_targets, {date(2026, 10, 19): 30 * _MINUTE})
+
+    def test_long_break_follows_interval(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 13))]
+        planner = StudyPlannerImpl(_config(), availability, 6 * 30 * _MINUTE)
+
+        breaks = [block.pomodoro_state for block in planner.blocks if block.pomodoro_state != PomodoroState.STUDYING]
+        self.assertEqual(breaks, [PomodoroState.SHORT_BREAK] * 3 + [PomodoroState.LONG_BREAK, PomodoroState.SHORT_BREAK])
+        self.assertEqual(planner.unmet_targets, {})
+
+    def test_windows_are_split_by_week(self):
+        availability = [(datetime(2026, 10, 25, 23), datetime(2026, 10, 26, 1))]
+        planner = StudyPlannerImpl(_config(), availability, 30 * _MINUTE)
+
+        self.assertEqual([(block.start, block.end) for block in planner.blocks],
+                         [(datetime(2026, 10, 25, 23), datetime(2026, 10, 25, 23, 30)),
+                          (datetime(2026, 10, 26, 0), datetime(2026, 10, 26, 0, 30))])
+
+    def test_target_keys_are_normalized_to_the_week(self):
+        availability = [(datetime(2026, 10, 20, 9), datetime(2026, 10, 20, 12))]
+        for key in (date(2026, 10, 20), datetime(2026, 10, 21, 8), date(2026, 10, 19)):
+            with self.subTest(key=key):
+                planner = StudyPlannerImpl(_config(), availability, {key: _HOUR})
+                self.assertEqual(_study_time(planner.blocks), _HOUR)
+                self.assertEqual(planner.unmet_targets, {})
+
+    def test_number_target_covers_weeks_without_windows(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 10, 5)),
+                        (datetime(2026, 11, 2, 9), datetime(2026, 11, 2, 10, 5))]
+        planner = StudyPlannerImpl(_config(), availability, 1.5 * _HOUR)
+
+        self.assertEqual(planner.unmet_targets, {date(2026, 10, 19): 30 * _MINUTE,
+                                                 date(2026, 10, 26): 90 * _MINUTE,
+                                                 date(2026, 11, 2): 30 * _MINUTE})
+
+    def test_end_session_early_replans_the_lost_time(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 12))]
+        planner = StudyPlannerImpl(_config(), availability, _HOUR)
+
+        planner.end_session_early(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 9, 10))
+
+        self.assertEqual(planner.blocks[0].end, datetime(2026, 10, 19, 9, 10))
+        self.assertEqual(planner.blocks[-1].end, datetime(2026, 10, 19, 10, 30))
+        self.assertEqual(_study_time(planner.blocks), _HOUR)
+        self.assertEqual(planner.unmet_targets, {})
+
+    def test_end_session_early_without_room_is_unmet(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 10, 5))]
+        planner = StudyPlannerImpl(_config(), availability, _HOUR)
+
+        planner.end_session_early(datetime(2026, 10, 19, 9, 35), datetime(2026, 10, 19, 9, 50))
+
+        self.assertEqual(planner.unmet_targets, {date(2026, 10, 19): 15 * _MINUTE})
+
+    def test_end_session_early_with_zero_length_breaks(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 12))]
+        planner = StudyPlannerImpl(_config(short_break_time=0, long_break_time=0), availability, _HOUR)
+
+        self.assertTrue(all(block.pomodoro_state == PomodoroState.STUDYING for block in planner.blocks))
+        planner.end_session_early(datetime(2026, 10, 19, 9, 30), datetime(2026, 10, 19, 9, 45))
+        self.assertEqual(_study_time(planner.blocks), _HOUR)
+
+    def test_end_session_early_rejects_invalid_calls(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 12))]
+        planner = StudyPlannerImpl(_config(), availability, _HOUR)
+        start = datetime(2026, 10, 19, 9)
+
+        for session_start, actual_end in ((start, start), (start, start + timedelta(hours=1)),
+                                          (datetime(2026, 10, 19, 9, 30), datetime(2026, 10, 19, 9, 32)),
+                                          (datetime(2026, 11, 2, 9), datetime(2026, 11, 2, 9, 10))):
+            with self.subTest(start=session_start, actual_end=actual_end), self.assertRaises(ValueError):
+                planner.end_session_early(session_start, actual_end)
+
+    def test_not_before_clips_the_windows(self):
+        availability = [(datetime(2026, 10, 19, 9), datetime(2026, 10, 19, 12))]
+        planner = StudyPlannerImpl(_config(), availability, 30 * _MINUTE, not_before=datetime(2026, 10, 19, 11))
+
+        self.assertEqual(planner.blocks[0].start, datetime(2026, 10, 19, 11))
+
+
+if __name__ == '__main__':
+    unittest.main()